@@ -26,24 +26,90 @@ Example usage::
         --output results/
 
 The configuration file must be JSON and contain the fields documented in
-``ConfigSchema``.  Results are saved as CSV and JSON files inside the output
-directory together with a human-readable Markdown summary.
+``ConfigSchema``.  Observations with a missing value in any variable
+referenced by the configuration (including the year variable), or in which
+an expression term such as ``np.log(x)`` is not finite, are dropped once
+for the whole search rather than per specification, so every
+specification is estimated on the same sample and results are comparable.
+
+Results are saved as CSV and JSON files inside the output directory together
+with a human-readable Markdown summary.
 """
 
 from __future__ import annotations
 
 import argparse
+import ast
+import contextlib
+import csv
+import functools
+import io
 import json
+import math
 import textwrap
+import warnings
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import (
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
+import numpy as np
 import pandas as pd
-import statsmodels.formula.api as smf
+import patsy
+from scipy import stats
+
+try:
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; pandas' own parser is used instead.
+    pacsv = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard json module is used instead.
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the OLS kernel then runs as plain NumPy.
+    njit = None
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # threadpoolctl is optional; BLAS then keeps its own thread count.
+    threadpool_limits = None
+
+_T = TypeVar("_T")
+
+# Smallest sample for which ``--precision float32`` takes effect; below it the
+# per-fit Python overhead outweighs the cheaper matrix products.
+FLOAT32_MIN_OBS = 1000
 
+# Coefficient statistics ``{name: (estimate, std_error, p_value)}``.
+CoeffStats = Mapping[str, Tuple[float, float, float]]
 
-@dataclass
+# Statistics of every specification fitted so far, keyed by
+# ``(sample, dependent, sorted right-hand-side terms)``, so that a
+# specification requested twice (e.g. a moderator that is also a control) is
+# only estimated once.  Values are read-only because they are shared.
+_FITTED_SPECIFICATIONS: Dict[Tuple["Sample", str, Tuple[str, ...]], CoeffStats] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class ConfigSchema:
     """Configuration options required by the automation utility."""
 
@@ -94,35 +160,120 @@ class ConfigSchema:
             model_type=model_type.lower(),
         )
 
+    def referenced_columns(self) -> List[str]:
+        """Dataset columns used by any specification, without duplicates.
+
+        Terms written as patsy expressions contribute the variables they read,
+        e.g. ``region`` for ``C(region)``.  Names that are not columns (such as
+        ``np``) are ignored by the callers.
+        """
+
+        terms = [self.dependent, *self.main_predictors, *self.controls, *self.moderators]
+        columns = [name for term in terms for name in term_variables(term)]
+        if self.year_variable:
+            columns.append(self.year_variable)
+        return list(dict.fromkeys(columns))
+
+
+def term_variables(term: str) -> List[str]:
+    """Return ``term`` followed by every variable name its patsy factors read."""
 
-@dataclass
+    names = [term]
+    try:
+        factors = [
+            ast.parse(factor.code.strip(), mode="eval")
+            for part in patsy.ModelDesc.from_formula(term).rhs_termlist
+            for factor in part.factors
+        ]
+    except (patsy.PatsyError, SyntaxError):
+        # Not a valid expression, so it can only be a literal column name.
+        return names
+    for factor in factors:
+        for node in ast.walk(factor):
+            if isinstance(node, ast.Name):
+                names.append(node.id)
+            elif (
+                # Q("odd name") quotes a column name that is not an identifier.
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == "Q"
+                and node.args
+                and isinstance(node.args[0], ast.Constant)
+            ):
+                names.append(node.args[0].value)
+    return names
+
+
+@dataclass(slots=True, frozen=True)
 class RegressionResult:
-    """Structured container for regression diagnostics."""
+    """Structured view of one recorded coefficient."""
 
     model_label: str
     formula: str
     dropped_years: int
     coefficient: str
     estimate: float
-    p_value: float
     std_error: float
+    p_value: float
     significant_10: bool
     significant_5: bool
     significant_1: bool
 
-    def as_dict(self) -> Dict[str, object]:
-        return {
-            "model_label": self.model_label,
-            "formula": self.formula,
-            "dropped_earliest_years": self.dropped_years,
-            "coefficient": self.coefficient,
-            "estimate": self.estimate,
-            "std_error": self.std_error,
-            "p_value": self.p_value,
-            "significant_at_10pct": self.significant_10,
-            "significant_at_5pct": self.significant_5,
-            "significant_at_1pct": self.significant_1,
-        }
+
+# Output column names, in the field order of ``RegressionResult``.
+RESULT_COLUMNS: Tuple[str, ...] = (
+    "model_label",
+    "formula",
+    "dropped_earliest_years",
+    "coefficient",
+    "estimate",
+    "std_error",
+    "p_value",
+    "significant_at_10pct",
+    "significant_at_5pct",
+    "significant_at_1pct",
+)
+
+# Results are accumulated column-wise (one list per output column) so that
+# they can be handed to pandas without building a dict per record.
+ResultColumns = Dict[str, List[object]]
+
+
+def new_result_columns() -> ResultColumns:
+    return {name: [] for name in RESULT_COLUMNS}
+
+
+def iter_results(results: ResultColumns) -> Iterator[RegressionResult]:
+    for row in zip(*(results[name] for name in RESULT_COLUMNS)):
+        yield RegressionResult(*row)
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class NumericData:
+    """All model variables as one Fortran-ordered floating-point matrix.
+
+    Column 0 is the intercept.  ``term_columns`` maps the dependent variable
+    and every right-hand-side term to its column indices (a categorical term
+    expands to several columns) and ``column_names`` names each column.
+    Instances compare by identity so that they can key the design cache.
+    """
+
+    values: np.ndarray
+    column_names: Tuple[str, ...]
+    term_columns: Dict[str, Tuple[int, ...]]
+
+
+@dataclass(slots=True, frozen=True)
+class Sample:
+    """An estimation sample: the contiguous rows ``start:stop`` of ``data``."""
+
+    data: NumericData
+    start: int
+    stop: int
+
+    @property
+    def rows(self) -> slice:
+        return slice(self.start, self.stop)
 
 
 def build_formula(dependent: str, rhs_terms: Iterable[str]) -> str:
@@ -133,186 +284,859 @@ def build_formula(dependent: str, rhs_terms: Iterable[str]) -> str:
     return f"{dependent} ~ {rhs}"
 
 
-def run_regression(formula: str, data: pd.DataFrame) -> Tuple[str, Dict[str, Tuple[float, float, float]]]:
-    """Fit an OLS regression and return coefficient statistics.
+def _ols_kernel(X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(beta, bse)`` from a Cholesky solve of the normal equations.
+
+    Compiled with numba when it is available.  Raises ``LinAlgError`` when the
+    design is rank deficient: rounding lets Cholesky succeed on a numerically
+    singular ``X'X``, so each pivot is also checked against its column.
+    """
+
+    n_obs, n_params = X.shape
+    xtx = X.T @ X
+    xty = X.T @ y
+    chol = np.linalg.cholesky(xtx)
+    # L[j, j]**2 / (X'X)[j, j] is the share of column j not explained by the
+    # columns before it; it is zero, up to rounding, for a collinear column.
+    tol = max(n_obs, n_params) * np.finfo(X.dtype).eps
+    for j in range(n_params):
+        if chol[j, j] ** 2 <= xtx[j, j] * tol:
+            raise np.linalg.LinAlgError("Design matrix is rank deficient")
+    chol_inv = np.linalg.solve(chol, np.eye(n_params, dtype=X.dtype))
+    beta = chol_inv.T @ (chol_inv @ xty)
+    resid = y - X @ beta
+    sigma2 = (resid @ resid) / (n_obs - n_params)
+    # inv(X'X) = inv(L)' inv(L), so its diagonal is the column sums of inv(L)**2.
+    bse = np.sqrt(sigma2 * (chol_inv**2).sum(axis=0))
+    return beta, bse
+
+
+if njit is not None:
+    # Compiled lazily and cached on disk.
+    # nogil lets the fits on the worker threads run concurrently.
+    _ols_kernel = njit(cache=True, nogil=True)(_ols_kernel)
+
+
+def _ols_pinv(X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Pseudo-inverse OLS for rank-deficient designs, matching statsmodels.
+
+    Returns ``(beta, bse, df_resid)``; as in statsmodels, the residual degrees
+    of freedom are based on the rank of ``X`` rather than its column count.
+    The fit is computed in double precision whatever the dtype of ``X``.
+    """
+
+    n_obs, n_params = X.shape
+    U, s, Vt = np.linalg.svd(np.asarray(X, dtype=np.float64), full_matrices=False)
+    if X.dtype == np.float32:
+        # Rounding to float32 perturbs an exact collinearity by about eps per
+        # column, so the rank is decided on unit-norm columns at that level.
+        norms = np.linalg.norm(X, axis=0).astype(np.float64)
+        norms[norms == 0] = 1.0
+        s_unit = np.linalg.svd(X / norms, compute_uv=False)
+        rank = int((s_unit > n_params * np.finfo(np.float32).eps).sum())
+    else:
+        # The same cutoff as ``np.linalg.matrix_rank``, so that the fit and
+        # its degrees of freedom agree.
+        rank = int((s > s[0] * max(n_obs, n_params) * np.finfo(np.float64).eps).sum())
+    U, s, Vt = U[:, :rank], s[:rank], Vt[:rank]
+    beta = Vt.T @ ((U.T @ y) / s)
+    resid = y - X @ beta
+    df_resid = n_obs - rank
+    sigma2 = (resid @ resid) / df_resid
+    # The unscaled covariance is pinv(X) pinv(X)' = V diag(s**-2) V'.
+    return beta, np.sqrt(sigma2 * ((Vt / s[:, None]) ** 2).sum(axis=0)), df_resid
+
+
+def _fit_ols_fast(X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve the OLS normal equations and return ``(beta, bse, pvals)``.
+
+    Only the quantities reported by the search are computed, which avoids the
+    overhead of a full statsmodels fit.  Rank-deficient designs fall back to
+    the Moore-Penrose pseudo-inverse, matching the statsmodels default.  Single
+    precision designs are solved by QR instead, because forming ``X'X`` in
+    float32 squares the condition number; if QR finds them (nearly) rank
+    deficient, they are fitted by the pseudo-inverse in double precision.
+    """
+
+    if np.result_type(X, y) == np.float32:
+        try:
+            return _fit_nested_ols(X, y, [X.shape[1]])[0]
+        except np.linalg.LinAlgError:
+            beta, bse, df_resid = _ols_pinv(X, y)
+            return beta, bse, _t_pvalues(beta, bse, df_resid)
+    X = np.asfortranarray(X, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    try:
+        beta, bse = _ols_kernel(X, y)
+        df_resid = X.shape[0] - X.shape[1]
+    except np.linalg.LinAlgError:
+        beta, bse, df_resid = _ols_pinv(X, y)
+    return beta, bse, _t_pvalues(beta, bse, df_resid)
+
+
+def _pivot_tolerance(dtype: np.dtype, n_obs: int, n_params: int) -> float:
+    """Pivot size, relative to a unit-norm column, below which it counts as collinear.
+
+    Double precision uses the ``np.linalg.matrix_rank`` default.  That bound
+    grows with ``n_obs``, and in single precision it would reject ordinary
+    uncentred regressors, so float32 uses ``sqrt(eps)`` instead: beyond that
+    collinearity float32 estimates carry no correct digits anyway.
+    """
 
-    The returned dictionary maps coefficient names to ``(estimate, std_error,
-    p_value)`` tuples.  ``model_summary`` contains the statsmodels text summary
-    for optional logging.
+    eps = np.finfo(dtype).eps
+    if dtype == np.float32:
+        return float(np.sqrt(eps))
+    return max(n_obs, n_params) * eps
+
+
+def _fit_nested_ols(
+    X: np.ndarray, y: np.ndarray, widths: Sequence[int]
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Fit OLS on the leading ``widths`` columns of ``X`` from one QR decomposition.
+
+    With ``X = QR``, the regression on the first ``k`` columns has the
+    triangular factor ``R[:k, :k]``, so every nested model is recovered from
+    the same factorisation without revisiting the observations.  Only the QR
+    itself runs in the precision of ``X``; the small triangular system and the
+    residual sums are handled in double precision.  Raises ``LinAlgError``
+    when the design is rank deficient.
     """
 
-    model = smf.ols(formula=formula, data=data).fit()
-    summary_text = model.summary().as_text()
-    coeff_stats = {
-        name: (float(model.params[name]), float(model.bse[name]), float(model.pvalues[name]))
-        for name in model.params.index
+    n_obs, n_params = X.shape
+    # With unit-norm columns |R[j, j]| is the sine of the angle between column
+    # j and the columns before it, which makes the rank test scale-invariant.
+    norms = np.sqrt(np.einsum("ij,ij->j", X, X, dtype=np.float64))
+    if not norms.all():
+        raise np.linalg.LinAlgError("Design matrix has an all-zero column")
+    Q, R = np.linalg.qr(X / norms.astype(X.dtype))
+    if np.abs(np.diag(R)).min() <= _pivot_tolerance(X.dtype, n_obs, n_params):
+        raise np.linalg.LinAlgError("Design matrix is rank deficient")
+    qty = Q.T @ y
+    resid = y - Q @ qty
+    rss_full = float(np.einsum("i,i->", resid, resid, dtype=np.float64))
+    qty = qty.astype(np.float64)
+    # inv(R)[:k, :k] is the inverse of R[:k, :k] because R is upper triangular.
+    r_inv = np.linalg.inv(R.astype(np.float64))
+    cov_diag = np.cumsum(r_inv**2, axis=1)
+    # Dropping trailing columns moves their share of Q'y into the residuals.
+    rss_tail = np.append(np.cumsum((qty**2)[::-1])[::-1], 0.0)
+
+    fits = []
+    for k in widths:
+        # Undo the column scaling.
+        beta = (r_inv[:k, :k] @ qty[:k]) / norms[:k]
+        dof = n_obs - k
+        sigma2 = (rss_full + rss_tail[k]) / dof
+        bse = np.sqrt(sigma2 * cov_diag[:k, k - 1]) / norms[:k]
+        fits.append((beta, bse, _t_pvalues(beta, bse, dof)))
+    return fits
+
+
+def _fit_ols_batched(
+    designs: Sequence[Tuple[np.ndarray, np.ndarray]], absorbed: int = 0
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Fit several regressions that share the same columns in one LAPACK call.
+
+    Each ``(X, y)`` pair may have its own observations; only the ``k x k``
+    cross-products are stacked, and ``np.linalg.solve``/``np.linalg.inv``
+    broadcast over the leading axis.  ``absorbed`` counts parameters already
+    partialled out of ``X`` and ``y``, which still use up degrees of freedom.
+    Raises ``LinAlgError`` if any of the designs is singular.
+    """
+
+    xtx = np.stack([X.T @ X for X, _ in designs])
+    xty = np.stack([X.T @ y for X, y in designs])
+    # The same pivot test as ``_ols_kernel``: inv and solve do not reliably
+    # raise on a numerically singular X'X.
+    pivots = np.diagonal(np.linalg.cholesky(xtx), axis1=1, axis2=2) ** 2
+    n_obs = max(X.shape[0] for X, _ in designs)
+    tol = max(n_obs, xtx.shape[-1]) * np.finfo(xtx.dtype).eps
+    if np.any(pivots <= np.diagonal(xtx, axis1=1, axis2=2) * tol):
+        raise np.linalg.LinAlgError("Design matrix is rank deficient")
+    xtx_inv = np.linalg.inv(xtx)
+    betas = np.linalg.solve(xtx, xty[..., np.newaxis])[..., 0]
+
+    fits = []
+    for (X, y), beta, cov_unscaled in zip(designs, betas, xtx_inv):
+        resid = y - X @ beta
+        dof = X.shape[0] - X.shape[1] - absorbed
+        sigma2 = (resid @ resid) / dof
+        bse = np.sqrt(sigma2 * np.diag(cov_unscaled))
+        fits.append((beta, bse, _t_pvalues(beta, bse, dof)))
+    return fits
+
+
+def _t_pvalues(beta: np.ndarray, bse: np.ndarray, dof: int) -> np.ndarray:
+    # Always in double precision: small p-values lose their tail in float32.
+    t_stats = np.abs(np.asarray(beta, dtype=np.float64) / np.asarray(bse, dtype=np.float64))
+    return 2 * stats.t.sf(t_stats, dof)
+
+
+def _coefficient_stats(
+    names: Sequence[str], beta: np.ndarray, bse: np.ndarray, pvals: np.ndarray
+) -> Dict[str, Tuple[float, float, float]]:
+    return {
+        name: (float(beta[idx]), float(bse[idx]), float(pvals[idx]))
+        for idx, name in enumerate(names)
     }
-    return summary_text, coeff_stats
+
+
+# ``(y, X, column_names, term_ends)``; ``term_ends`` maps each right-hand-side
+# term to the index just past its last column in ``X``.
+Design = Tuple[np.ndarray, np.ndarray, List[str], Dict[str, int]]
+
+
+def _is_plain_numeric(data: pd.DataFrame, name: str) -> bool:
+    # patsy treats booleans and strings as categorical, so those keep using it.
+    return name in data.columns and data[name].dtype.kind in "iuf"
+
+
+def build_numeric_data(
+    data: pd.DataFrame, dependent: str, terms: Sequence[str]
+) -> Tuple[NumericData, np.ndarray]:
+    """Convert the dependent variable and ``terms`` of ``data`` into ``NumericData``.
+
+    Numeric columns are copied straight into the matrix.  If any term is an
+    expression or categorical (e.g. ``np.log(x)`` or ``C(region)``), patsy
+    builds the columns once for the whole data set instead.  Rows in which a
+    column is not finite, such as ``np.log`` of a negative number, are left
+    out, as patsy would drop them per model.  Returns the matrix and a boolean
+    mask of the rows of ``data`` that it keeps, in their original order.
+    """
+
+    terms = [term for term in dict.fromkeys(terms) if term != dependent]
+    if all(_is_plain_numeric(data, name) for name in [dependent, *terms]):
+        names = [dependent, *terms]
+        values = np.empty((len(data), len(names) + 1), order="F")
+        values[:, 0] = 1.0
+        values[:, 1:] = data[names].to_numpy(dtype=np.float64)
+        column_names = ("Intercept", *names)
+        term_columns = {name: (idx,) for idx, name in enumerate(column_names) if idx}
+    else:
+        # Keep every row so that the result stays aligned with ``data``; the
+        # rows with missing values are masked below.
+        y, X = patsy.dmatrices(
+            build_formula(dependent, terms),
+            data,
+            NA_action=patsy.NAAction(NA_types=[]),
+            return_type="matrix",
+        )
+        slices = {term.name(): cols for term, cols in X.design_info.term_slices.items()}
+        values = np.asfortranarray(np.column_stack([X, y]), dtype=np.float64)
+        column_names = (*X.design_info.column_names, dependent)
+        term_columns = {dependent: (values.shape[1] - 1,)}
+        for term in terms:
+            parsed = patsy.ModelDesc.from_formula(term).rhs_termlist
+            term_columns[term] = tuple(
+                idx
+                for part in parsed
+                if part.factors
+                for idx in range(slices[part.name()].start, slices[part.name()].stop)
+            )
+
+    complete = np.isfinite(values).all(axis=1)
+    if not complete.all():
+        values = np.asfortranarray(values[complete])
+    return NumericData(values, column_names, term_columns), complete
+
+
+def single_precision_agrees(data: NumericData, dependent: str, rtol: float = 1e-2) -> bool:
+    """Check that float32 reproduces the float64 fit of the full model on ``data``.
+
+    The dependent variable is regressed on every other column in both
+    precisions; the float32 coefficients and standard errors must lie within
+    ``rtol`` float64 standard errors of the float64 ones.
+    """
+
+    dep = data.term_columns[dependent][0]
+    X = np.delete(data.values, dep, axis=1)
+    y = data.values[:, dep]
+    beta64, bse64, _ = _fit_ols_fast(X, y)
+    beta32, bse32, _ = _fit_ols_fast(X.astype(np.float32, order="F"), y.astype(np.float32))
+    tol = rtol * bse64
+    return bool(
+        np.all(np.abs(beta32 - beta64) <= tol) and np.all(np.abs(bse32 - bse64) <= tol)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _design(data: NumericData, dependent: str, rhs_terms: Tuple[str, ...]) -> Design:
+    indices = [0]
+    term_ends: Dict[str, int] = {}
+    for term in rhs_terms:
+        for idx in data.term_columns[term]:
+            if idx not in indices:
+                indices.append(idx)
+        term_ends.setdefault(term, len(indices))
+    column_names = [data.column_names[idx] for idx in indices]
+    y = data.values[:, data.term_columns[dependent][0]]
+    return y, data.values[:, indices], column_names, term_ends
+
+
+def design_matrices(dependent: str, rhs_terms: Sequence[str], sample: Sample) -> Design:
+    """Return the design of ``dependent`` on ``rhs_terms`` (plus an intercept) for ``sample``.
+
+    The design is assembled once per data set by selecting columns of the
+    shared matrix (a Fortran-ordered copy) and cached; each sample then takes
+    a row slice of it, which is a view.
+    """
+
+    y, X, column_names, term_ends = _design(sample.data, dependent, tuple(rhs_terms))
+    return y[sample.rows], X[sample.rows], column_names, term_ends
+
+
+def _specification_key(
+    dependent: str, rhs_terms: Sequence[str], sample: Sample
+) -> Tuple[Sample, str, Tuple[str, ...]]:
+    return sample, dependent, tuple(sorted(set(rhs_terms)))
+
+
+def _remember_fit(
+    key: Tuple[Sample, str, Tuple[str, ...]], coeff_stats: Dict[str, Tuple[float, float, float]]
+) -> CoeffStats:
+    return _FITTED_SPECIFICATIONS.setdefault(key, MappingProxyType(coeff_stats))
+
+
+def clear_caches() -> None:
+    _FITTED_SPECIFICATIONS.clear()
+    _design.cache_clear()
+    _partial_out_design.cache_clear()
+
+
+def run_regression(dependent: str, rhs_terms: Sequence[str], sample: Sample) -> CoeffStats:
+    """Fit an OLS regression and return coefficient statistics.
+
+    The returned mapping sends coefficient names to ``(estimate, std_error,
+    p_value)`` tuples.  Results are cached per sample and set of terms.
+    """
+
+    key = _specification_key(dependent, rhs_terms, sample)
+    if key in _FITTED_SPECIFICATIONS:
+        return _FITTED_SPECIFICATIONS[key]
+    y, X, column_names, _ = design_matrices(dependent, rhs_terms, sample)
+    return _remember_fit(key, _coefficient_stats(column_names, *_fit_ols_fast(X, y)))
+
+
+def run_regression_batch(
+    dependent: str, rhs_terms: Sequence[str], samples: Sequence[Sample]
+) -> List[CoeffStats]:
+    """Fit the same specification on several samples together.
+
+    Falls back to one fit per sample when any of the designs is singular or
+    the data are single precision.
+    """
+
+    keys = [_specification_key(dependent, rhs_terms, sample) for sample in samples]
+    if all(key in _FITTED_SPECIFICATIONS for key in keys):
+        return [_FITTED_SPECIFICATIONS[key] for key in keys]
+
+    designs = []
+    for sample in samples:
+        y, X, column_names, _ = design_matrices(dependent, rhs_terms, sample)
+        designs.append((X, y))
+
+    fits = None
+    # In single precision stacking X'X would square the condition number, so
+    # those designs are fitted one at a time by QR.
+    if X.dtype == np.float64:
+        try:
+            fits = _fit_ols_batched(designs)
+        except np.linalg.LinAlgError:
+            pass
+    if fits is None:
+        fits = [_fit_ols_fast(X, y) for X, y in designs]
+    return [
+        _remember_fit(key, _coefficient_stats(column_names, *fit)) for key, fit in zip(keys, fits)
+    ]
+
+
+def _term_indices(data: NumericData, terms: Sequence[str]) -> List[int]:
+    return list(dict.fromkeys(idx for term in terms for idx in data.term_columns[term]))
+
+
+# ``(W, targets, spec_columns, spec_names)``: the intercept and shared columns,
+# the dependent variable followed by every own column, and for each
+# specification the positions of its own columns in ``targets`` and their names.
+PartialOutDesign = Tuple[np.ndarray, np.ndarray, List[np.ndarray], List[List[str]]]
+
+
+@functools.lru_cache(maxsize=None)
+def _partial_out_design(
+    data: NumericData,
+    dependent: str,
+    shared_terms: Tuple[str, ...],
+    spec_terms: Tuple[Tuple[str, ...], ...],
+) -> PartialOutDesign:
+    shared_idx = [0, *_term_indices(data, shared_terms)]
+    own_idx = _term_indices(data, [term for terms in spec_terms for term in terms])
+    position = {idx: pos for pos, idx in enumerate(own_idx, start=1)}
+    spec_columns = []
+    spec_names = []
+    for terms in spec_terms:
+        columns = [idx for term in terms for idx in data.term_columns[term]]
+        spec_columns.append(np.array([position[idx] for idx in columns], dtype=np.intp))
+        spec_names.append([data.column_names[idx] for idx in columns])
+    targets = data.values[:, [*data.term_columns[dependent], *own_idx]]
+    return data.values[:, shared_idx], targets, spec_columns, spec_names
+
+
+def can_partial_out(
+    dependent: str,
+    shared_terms: Sequence[str],
+    spec_terms: Sequence[Sequence[str]],
+    data: NumericData,
+) -> bool:
+    """Whether ``run_partialled_regressions`` reproduces the separate fits.
+
+    The columns of each specification's own terms must be distinct and
+    disjoint from the dependent variable, the intercept and ``shared_terms``,
+    and the data must be double precision: the batched solve forms ``X'X``.
+    """
+
+    if data.values.dtype != np.float64:
+        return False
+    shared = {0, *_term_indices(data, [dependent, *shared_terms])}
+    for terms in spec_terms:
+        own = [idx for term in terms for idx in data.term_columns[term]]
+        if len(set(own)) != len(own) or shared.intersection(own):
+            return False
+    return True
+
+
+def run_partialled_regressions(
+    dependent: str,
+    shared_terms: Sequence[str],
+    spec_terms: Sequence[Sequence[str]],
+    sample: Sample,
+) -> List[CoeffStats]:
+    """Fit specifications that differ only in a few terms beyond ``shared_terms``.
+
+    By the Frisch-Waugh-Lovell theorem, the coefficients of a specification's
+    own terms equal those from regressing the dependent variable, residualised
+    on the intercept and ``shared_terms``, on its residualised own terms.  The
+    dependent variable and every own term are residualised together as one
+    multi-output OLS against the shared block, and the small per-specification
+    fits are then solved as a batch.  Only the own terms are reported.  Check
+    ``can_partial_out`` first.  Raises ``LinAlgError`` when a specification's
+    design is rank deficient; fit the specifications separately then.
+
+    The column layout is resolved once per data set and cached, so each
+    sample only takes row slices of it.
+    """
+
+    W, targets, spec_columns, spec_names = _partial_out_design(
+        sample.data,
+        dependent,
+        tuple(shared_terms),
+        tuple(tuple(terms) for terms in spec_terms),
+    )
+    W, targets = W[sample.rows], targets[sample.rows]
+    # lstsq copes with collinear shared terms; only ``rank`` parameters are
+    # absorbed, as statsmodels would count them.
+    coef, _, rank, _ = np.linalg.lstsq(W, targets, rcond=None)
+    resid = targets - W @ coef
+    # An own column that the shared terms explain leaves only rounding noise,
+    # which the batched solve cannot tell apart from a genuine regressor.
+    total_ss = np.einsum("ij,ij->j", targets, targets)
+    resid_ss = np.einsum("ij,ij->j", resid, resid)
+    tol = max(W.shape) * np.finfo(resid.dtype).eps
+    if np.any(resid_ss[1:] <= total_ss[1:] * tol):
+        raise np.linalg.LinAlgError("Own terms are collinear with the shared terms")
+    designs = [(resid[:, columns], resid[:, 0]) for columns in spec_columns]
+    fits = _fit_ols_batched(designs, absorbed=int(rank))
+    return [_coefficient_stats(names, *fit) for names, fit in zip(spec_names, fits)]
+
+
+def run_nested_regressions(
+    dependent: str, ladder: Sequence[Sequence[str]], sample: Sample
+) -> List[CoeffStats]:
+    """Fit a ladder of nested specifications, each extending the previous one.
+
+    The design matrix for the largest specification is built once and every
+    rung is read off a single QR decomposition.  When the design is rank
+    deficient, each rung is fitted separately instead.
+    """
+
+    keys = [_specification_key(dependent, rhs, sample) for rhs in ladder]
+    if all(key in _FITTED_SPECIFICATIONS for key in keys):
+        return [_FITTED_SPECIFICATIONS[key] for key in keys]
+
+    y, X, column_names, term_ends = design_matrices(dependent, ladder[-1], sample)
+    widths = [max(term_ends[term] for term in rhs) for rhs in ladder]
+    try:
+        fits = _fit_nested_ols(X, y, widths)
+    except np.linalg.LinAlgError:
+        return [run_regression(dependent, rhs, sample) for rhs in ladder]
+    return [
+        _remember_fit(key, _coefficient_stats(column_names[:width], *fit))
+        for key, width, fit in zip(keys, widths, fits)
+    ]
 
 
 def record_coefficients(
-    results: List[RegressionResult],
+    results: ResultColumns,
     model_label: str,
     formula: str,
     dropped_years: int,
-    coeff_stats: Dict[str, Tuple[float, float, float]],
+    coeff_stats: CoeffStats,
     focus_terms: Sequence[str],
+    writer: Optional[ResultWriter] = None,
 ) -> None:
     for term in focus_terms:
         if term not in coeff_stats:
-            # Skip silently so that interaction-only models do not break when
-            # statsmodels drops collinear terms.
+            # Skip silently: terms that patsy expands into several columns
+            # (e.g. ``C(region)``) have no single coefficient to report.
             continue
         estimate, std_error, p_value = coeff_stats[term]
-        results.append(
-            RegressionResult(
-                model_label=model_label,
-                formula=formula,
-                dropped_years=dropped_years,
-                coefficient=term,
-                estimate=estimate,
-                std_error=std_error,
-                p_value=p_value,
-                significant_10=p_value < 0.1,
-                significant_5=p_value < 0.05,
-                significant_1=p_value < 0.01,
-            )
+        row = (
+            model_label,
+            formula,
+            dropped_years,
+            term,
+            estimate,
+            std_error,
+            p_value,
+            p_value < 0.1,
+            p_value < 0.05,
+            p_value < 0.01,
         )
+        for name, value in zip(RESULT_COLUMNS, row):
+            results[name].append(value)
+        if writer is not None:
+            writer.write(row)
+
+
+def drop_incomplete_rows(data: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    """Drop rows with a missing value in any of ``columns`` that exist in ``data``.
+
+    Doing this once, instead of per fitted model, makes every specification use
+    the same observations.  Pass ``ConfigSchema.referenced_columns()`` so that
+    the variables read by expression terms (``region`` in ``C(region)``) are
+    covered as well.
+    """
+
+    present = [name for name in columns if name in data.columns]
+    return data.dropna(subset=present).reset_index(drop=True)
+
+
+def interaction_column(predictor: str, moderator: str) -> str:
+    return f"{predictor}_x_{moderator}"
 
 
-def iteratively_drop_years(
-    data: pd.DataFrame, year_var: str, drop_counts: Sequence[int]
-) -> Dict[int, pd.DataFrame]:
-    if not drop_counts:
-        return {0: data}
+def add_interaction_columns(
+    data: pd.DataFrame, main_predictors: Sequence[str], moderators: Sequence[str]
+) -> Dict[Tuple[str, str], str]:
+    """Materialise every ``predictor x moderator`` product as a column of ``data``.
 
-    sorted_years = sorted(data[year_var].dropna().unique())
-    frames: Dict[int, pd.DataFrame] = {}
+    Computing the products once up front lets the moderation models use plain
+    additive formulas.  Pairs involving an expression or a non-numeric column
+    (e.g. ``I(x1**2)`` or ``C(region)``) keep patsy's ``predictor:moderator``
+    term instead.  Returns the interaction term of every pair.
+    """
+
+    terms: Dict[Tuple[str, str], str] = {}
+    for predictor in main_predictors:
+        for moderator in moderators:
+            if (predictor, moderator) in terms:
+                continue
+            if not (_is_plain_numeric(data, predictor) and _is_plain_numeric(data, moderator)):
+                terms[predictor, moderator] = f"{predictor}:{moderator}"
+                continue
+            name = interaction_column(predictor, moderator)
+            if name in data.columns:
+                raise ValueError(
+                    f"Cannot add the interaction column '{name}': the dataset already "
+                    "has a column with that name."
+                )
+            data[name] = data[predictor].to_numpy(dtype=np.float64) * data[
+                moderator
+            ].to_numpy(dtype=np.float64)
+            terms[predictor, moderator] = name
+    return terms
+
+
+def drop_year_bounds(
+    years: np.ndarray, drop_counts: Sequence[int]
+) -> Dict[int, Tuple[int, int]]:
+    """Locate the samples that drop the earliest years.
+
+    ``years`` holds the year of every row, sorted and complete; ``main`` sorts
+    the data by year and drops rows with a missing year beforehand.  Returns,
+    for each drop count, the ``(start, stop)`` row range of its sample, found
+    with ``np.searchsorted``.
+    """
+
+    sorted_years = pd.unique(years)
+    bounds: Dict[int, Tuple[int, int]] = {0: (0, len(years))}
     for drop_n in drop_counts:
         if drop_n <= 0:
-            frames[0] = data
             continue
         if drop_n >= len(sorted_years):
             raise ValueError(
                 "Cannot drop more years than exist in the dataset. "
                 f"Attempted to drop {drop_n} of {len(sorted_years)} years."
             )
-        threshold_years = sorted_years[drop_n:]
-        frames[drop_n] = data[data[year_var].isin(threshold_years)].copy()
-    if 0 not in frames:
-        frames[0] = data
-    return frames
+        start = int(np.searchsorted(years, sorted_years[drop_n], side="left"))
+        bounds[drop_n] = (start, len(years))
+    return bounds
+
+
+def _map_tasks(
+    executor: Optional[Executor], func: Callable[..., _T], *iterables: Iterable[object]
+) -> List[_T]:
+    """Map ``func`` over the tasks, preserving order, on ``executor`` if given."""
+
+    if executor is None:
+        return list(map(func, *iterables))
+    return list(executor.map(func, *iterables))
 
 
 def run_baseline_and_controls(
     cfg: ConfigSchema,
-    data_variants: Dict[int, pd.DataFrame],
-    results: List[RegressionResult],
+    data_variants: Dict[int, Sample],
+    results: ResultColumns,
+    executor: Optional[Executor] = None,
+    writer: Optional[ResultWriter] = None,
 ) -> None:
-    for drop_count, subset in data_variants.items():
-        # Baseline: only main predictors
-        formula = build_formula(cfg.dependent, cfg.main_predictors)
-        _, coeff_stats = run_regression(formula, subset)
-        record_coefficients(
-            results,
-            model_label="baseline_main_effects",
-            formula=formula,
-            dropped_years=drop_count,
-            coeff_stats=coeff_stats,
-            focus_terms=cfg.main_predictors,
-        )
+    # Baseline (main predictors only) followed by one control added at a time.
+    ladder = [list(cfg.main_predictors)]
+    labels = ["baseline_main_effects"]
+    for end_idx in range(1, len(cfg.controls) + 1):
+        ladder.append(list(cfg.main_predictors) + list(cfg.controls[:end_idx]))
+        labels.append(f"incremental_controls_{end_idx}")
 
-        if not cfg.controls:
-            continue
-
-        for end_idx in range(1, len(cfg.controls) + 1):
-            active_controls = cfg.controls[:end_idx]
-            rhs_terms = list(cfg.main_predictors) + list(active_controls)
-            formula = build_formula(cfg.dependent, rhs_terms)
-            _, coeff_stats = run_regression(formula, subset)
-            label = f"incremental_controls_{end_idx}"
+    drop_counts = list(data_variants)
+    samples = [data_variants[drop_count] for drop_count in drop_counts]
+    # Build the shared design up front so that the workers only slice it.
+    _design(samples[0].data, cfg.dependent, tuple(ladder[-1]))
+    all_ladder_stats = _map_tasks(
+        executor,
+        lambda sample: run_nested_regressions(cfg.dependent, ladder, sample),
+        samples,
+    )
+    for drop_count, ladder_stats in zip(drop_counts, all_ladder_stats):
+        for label, rhs_terms, coeff_stats in zip(labels, ladder, ladder_stats):
             record_coefficients(
                 results,
                 model_label=label,
-                formula=formula,
+                formula=build_formula(cfg.dependent, rhs_terms),
                 dropped_years=drop_count,
                 coeff_stats=coeff_stats,
-                focus_terms=list(cfg.main_predictors) + list(active_controls),
+                focus_terms=rhs_terms,
+                writer=writer,
             )
 
 
 def run_moderation_checks(
     cfg: ConfigSchema,
-    data_variants: Dict[int, pd.DataFrame],
-    results: List[RegressionResult],
+    data_variants: Dict[int, Sample],
+    results: ResultColumns,
+    executor: Optional[Executor] = None,
+    writer: Optional[ResultWriter] = None,
+    interaction_terms: Optional[Mapping[Tuple[str, str], str]] = None,
 ) -> None:
     if not cfg.moderators:
         return
 
-    for drop_count, subset in data_variants.items():
-        for moderator in cfg.moderators:
-            for predictor in cfg.main_predictors:
-                interaction_term = f"{predictor}:{moderator}"
-                rhs_terms = [predictor, moderator, f"{predictor}*{moderator}"]
-                rhs_terms.extend(cfg.controls)
-                formula = build_formula(cfg.dependent, rhs_terms)
-                _, coeff_stats = run_regression(formula, subset)
-                model_label = f"moderation_{predictor}_x_{moderator}"
-                record_coefficients(
-                    results,
-                    model_label=model_label,
-                    formula=formula,
-                    dropped_years=drop_count,
-                    coeff_stats=coeff_stats,
-                    focus_terms=[predictor, moderator, interaction_term],
+    # ``interaction_terms`` comes from ``add_interaction_columns``; by default
+    # every product is assumed to be a materialised column.
+    specs = []
+    for moderator in cfg.moderators:
+        for predictor in cfg.main_predictors:
+            if interaction_terms is None:
+                interaction_term = interaction_column(predictor, moderator)
+            else:
+                interaction_term = interaction_terms[predictor, moderator]
+            rhs_terms = [predictor, moderator, interaction_term]
+            rhs_terms.extend(cfg.controls)
+            specs.append(
+                (
+                    rhs_terms,
+                    f"moderation_{predictor}_x_{moderator}",
+                    [predictor, moderator, interaction_term],
                 )
+            )
+
+    drop_counts = list(data_variants)
+    samples = [data_variants[drop_count] for drop_count in drop_counts]
+    own_terms = [focus_terms for _, _, focus_terms in specs]
+    if can_partial_out(cfg.dependent, cfg.controls, own_terms, samples[0].data):
+        # The specifications share the controls: partial them out once per
+        # sample for all specifications together.  The column layout is
+        # resolved here, before the workers start slicing it.
+        _partial_out_design(
+            samples[0].data,
+            cfg.dependent,
+            tuple(cfg.controls),
+            tuple(tuple(terms) for terms in own_terms),
+        )
+        try:
+            by_sample = _map_tasks(
+                executor,
+                lambda sample: run_partialled_regressions(
+                    cfg.dependent, cfg.controls, own_terms, sample
+                ),
+                samples,
+            )
+            fitted = [list(spec_stats) for spec_stats in zip(*by_sample)]
+        except np.linalg.LinAlgError:
+            # Some design is rank deficient: fit the specifications in full.
+            fitted = None
+    else:
+        fitted = None
+    if fitted is None:
+        # Fit each specification on every sample at once.
+        fitted = _map_tasks(
+            executor,
+            lambda rhs_terms: run_regression_batch(cfg.dependent, rhs_terms, samples),
+            [rhs_terms for rhs_terms, _, _ in specs],
+        )
+
+    # Record the results in the usual sample-by-sample order.
+    for variant_idx, drop_count in enumerate(drop_counts):
+        for (rhs_terms, model_label, focus_terms), spec_stats in zip(specs, fitted):
+            record_coefficients(
+                results,
+                model_label=model_label,
+                formula=build_formula(cfg.dependent, rhs_terms),
+                dropped_years=drop_count,
+                coeff_stats=spec_stats[variant_idx],
+                focus_terms=focus_terms,
+                writer=writer,
+            )
+
+
+_SUMMARY_TABLE_HEADER = (
+    "|Coefficient|Drop earliest years|Estimate|Std. Error|p-value|Sig. 10%|Sig. 5%|Sig. 1%|\n"
+    "|---|---|---|---|---|---|---|---|\n"
+)
+_SUMMARY_ROW = "|{}|{}|{:.4f}|{:.4f}|{:.4f}|{}|{}|{}|\n"
+_SIGNIFICANCE_MARKS = ("", "✅")
 
 
 def summarise_results(results: Sequence[RegressionResult]) -> str:
     if not results:
         return "No models were estimated."
 
-    lines = ["# Model search summary", ""]
-    grouped: Dict[str, List[RegressionResult]] = {}
+    grouped: DefaultDict[str, List[RegressionResult]] = defaultdict(list)
     for item in results:
-        grouped.setdefault(item.model_label, []).append(item)
-
-    for label, group in sorted(grouped.items()):
-        lines.append(f"## {label}")
-        lines.append("|Coefficient|Drop earliest years|Estimate|Std. Error|p-value|Sig. 10%|Sig. 5%|Sig. 1%|")
-        lines.append("|---|---|---|---|---|---|---|---|")
-        for entry in sorted(group, key=lambda x: (x.dropped_years, x.coefficient)):
-            lines.append(
-                "|{coef}|{drop}|{est:.4f}|{se:.4f}|{pval:.4f}|{sig10}|{sig5}|{sig1}|".format(
-                    coef=entry.coefficient,
-                    drop=entry.dropped_years,
-                    est=entry.estimate,
-                    se=entry.std_error,
-                    pval=entry.p_value,
-                    sig10="✅" if entry.significant_10 else "",
-                    sig5="✅" if entry.significant_5 else "",
-                    sig1="✅" if entry.significant_1 else "",
+        grouped[item.model_label].append(item)
+
+    sort_key = attrgetter("dropped_years", "coefficient")
+    buffer = io.StringIO()
+    buffer.write("# Model search summary\n")
+    for label in sorted(grouped):
+        group = grouped[label]
+        group.sort(key=sort_key)
+        buffer.write(f"\n## {label}\n")
+        buffer.write(_SUMMARY_TABLE_HEADER)
+        for entry in group:
+            buffer.write(
+                _SUMMARY_ROW.format(
+                    entry.coefficient,
+                    entry.dropped_years,
+                    entry.estimate,
+                    entry.std_error,
+                    entry.p_value,
+                    _SIGNIFICANCE_MARKS[entry.significant_10],
+                    _SIGNIFICANCE_MARKS[entry.significant_5],
+                    _SIGNIFICANCE_MARKS[entry.significant_1],
                 )
             )
-        lines.append("")
 
-    return "\n".join(lines)
+    return buffer.getvalue()
 
 
 def ensure_output_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def save_results(results: Sequence[RegressionResult], output_dir: Path) -> None:
+def _dumps_json(record: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record)
+    # Like orjson, write NaN and infinite statistics as null: bare NaN is not JSON.
+    finite = {
+        key: None if isinstance(value, float) and not math.isfinite(value) else value
+        for key, value in record.items()
+    }
+    return json.dumps(
+        finite, allow_nan=False, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class ResultWriter:
+    """Stream recorded coefficients to the CSV and JSON result files.
+
+    Rows are buffered and handed in batches to a single background thread
+    that formats and writes them, so file output overlaps with the remaining
+    fits and the full result set is never materialised as a table.  The JSON
+    file holds an array with one record per line.
+    """
+
+    batch_size = 1024
+
+    def __init__(self, output_dir: Path) -> None:
+        ensure_output_directory(output_dir)
+        self._csv_file = (output_dir / "regression_search_results.csv").open(
+            "w", newline="", encoding="utf-8"
+        )
+        self._json_file = (output_dir / "regression_search_results.json").open("wb")
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(RESULT_COLUMNS)
+        self._json_file.write(b"[")
+        self._json_separator = b"\n"
+        self._pending: List[Sequence[object]] = []
+        self._io = ThreadPoolExecutor(max_workers=1)
+        self._futures: List[Future[None]] = []
+
+    def write(self, row: Sequence[object]) -> None:
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Queue the buffered rows for writing in the background."""
+
+        if self._pending:
+            self._futures.append(self._io.submit(self._write_rows, self._pending))
+            self._pending = []
+
+    def _write_rows(self, rows: Sequence[Sequence[object]]) -> None:
+        self._csv_writer.writerows(rows)
+        for row in rows:
+            self._json_file.write(self._json_separator)
+            self._json_file.write(_dumps_json(dict(zip(RESULT_COLUMNS, row))))
+            self._json_separator = b",\n"
+
+    def close(self) -> None:
+        self.flush()
+        self._io.shutdown(wait=True)
+        try:
+            for future in self._futures:
+                future.result()
+            self._json_file.write(b"\n]\n")
+        finally:
+            self._json_file.close()
+            self._csv_file.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def save_summary(results: ResultColumns, output_dir: Path) -> None:
     ensure_output_directory(output_dir)
-    records = [entry.as_dict() for entry in results]
-    df = pd.DataFrame.from_records(records)
-    csv_path = output_dir / "regression_search_results.csv"
-    json_path = output_dir / "regression_search_results.json"
     markdown_path = output_dir / "regression_search_summary.md"
-    df.to_csv(csv_path, index=False)
-    df.to_json(json_path, orient="records", indent=2)
-    markdown_path.write_text(summarise_results(results), encoding="utf-8")
+    markdown_path.write_text(summarise_results(list(iter_results(results))), encoding="utf-8")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
 
 
 def parse_args() -> argparse.Namespace:
@@ -327,6 +1151,21 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--output", type=Path, default=Path("regression_search_output"), help="Directory to store outputs."
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Number of worker threads used to fit specifications; chosen from the CPU count if omitted.",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=("float32", "float64"),
+        default="float64",
+        help="Floating-point precision of the design matrices. float32 makes large fits cheaper "
+        "but applies to the whole run: it falls back to float64, with a warning, if any "
+        f"drop-years sample has fewer than {FLOAT32_MIN_OBS} observations or a float32 fit of "
+        "the full model does not reproduce the float64 estimates.",
+    )
     return parser.parse_args()
 
 
@@ -335,14 +1174,39 @@ def load_configuration(path: Path) -> ConfigSchema:
     return ConfigSchema.from_dict(config_dict)
 
 
-def load_data(path: Path) -> pd.DataFrame:
-    return pd.read_csv(path)
+def load_data(path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Read the CSV dataset, keeping only ``columns`` when given.
+
+    Requested columns that are absent from the file are ignored here so that
+    the caller can report them.  When pyarrow is installed, its multi-threaded
+    CSV reader is used.
+    """
+
+    wanted = None if columns is None else set(columns)
+    if pacsv is None:
+        usecols = None if wanted is None else (lambda name: name in wanted)
+        return pd.read_csv(path, usecols=usecols)
+
+    include_columns = None
+    if wanted is not None:
+        with pacsv.open_csv(path) as reader:
+            header = reader.schema.names
+        include_columns = [name for name in header if name in wanted]
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        # Like pandas, read empty string cells as missing values.
+        convert_options=pacsv.ConvertOptions(
+            include_columns=include_columns, strings_can_be_null=True
+        ),
+    )
+    return table.to_pandas(split_blocks=True, self_destruct=True)
 
 
 def main() -> None:
     args = parse_args()
     config = load_configuration(args.config)
-    data = load_data(args.data)
+    data = load_data(args.data, config.referenced_columns())
 
     if config.year_variable and config.year_variable not in data.columns:
         raise ValueError(
@@ -351,18 +1215,74 @@ def main() -> None:
             )
         )
 
-    data_variants = (
-        iteratively_drop_years(data, config.year_variable, config.drop_earliest_years)
-        if config.year_variable
-        else {0: data}
+    data = drop_incomplete_rows(data, config.referenced_columns())
+    interaction_terms = add_interaction_columns(data, config.main_predictors, config.moderators)
+    if config.year_variable:
+        # Year order lets every drop-years sample be a contiguous row range.
+        data = data.sort_values(config.year_variable, kind="mergesort")
+
+    # From here on every fit works on slices of one numeric matrix.
+    numeric, complete = build_numeric_data(
+        data,
+        config.dependent,
+        [
+            *config.main_predictors,
+            *config.controls,
+            *config.moderators,
+            *interaction_terms.values(),
+        ],
     )
+    # The sample bounds are located on the rows that the matrix kept.
+    if config.year_variable and config.drop_earliest_years:
+        bounds = drop_year_bounds(
+            data[config.year_variable].to_numpy()[complete], config.drop_earliest_years
+        )
+    else:
+        bounds = {0: (0, len(numeric.values))}
+    if args.precision == "float32":
+        # Single precision only pays off once every fit is large enough for
+        # the matrix products to dominate, and is only used if it reproduces
+        # the double-precision fit of the full model.
+        if min(stop - start for start, stop in bounds.values()) < FLOAT32_MIN_OBS:
+            warnings.warn(
+                f"a sample has fewer than {FLOAT32_MIN_OBS} observations; using float64"
+            )
+        elif not single_precision_agrees(numeric, config.dependent):
+            warnings.warn("float32 does not reproduce the float64 estimates; using float64")
+        else:
+            numeric = NumericData(
+                numeric.values.astype(np.float32, order="F"),
+                numeric.column_names,
+                numeric.term_columns,
+            )
+    data_variants = {
+        drop_count: Sample(numeric, start, stop) for drop_count, (start, stop) in bounds.items()
+    }
 
-    results: List[RegressionResult] = []
-    run_baseline_and_controls(config, data_variants, results)
-    run_moderation_checks(config, data_variants, results)
-    save_results(results, args.output)
+    # Each worker runs its own LAPACK calls, so a multi-threaded BLAS would
+    # oversubscribe the CPUs.  BLAS thread pools are process-wide, hence the
+    # limit is applied around the worker pool rather than inside each worker.
+    blas_limit = (
+        threadpool_limits(limits=1, user_api="blas")
+        if threadpool_limits is not None and args.jobs != 1
+        else contextlib.nullcontext()
+    )
+    results = new_result_columns()
+    with blas_limit, ResultWriter(args.output) as writer, ThreadPoolExecutor(
+        max_workers=args.jobs
+    ) as executor:
+        run_baseline_and_controls(config, data_variants, results, executor, writer)
+        # Write the baseline rows while the moderation models are fitted.
+        writer.flush()
+        run_moderation_checks(
+            config, data_variants, results, executor, writer, interaction_terms
+        )
+        writer.flush()
+        # The summary is rendered while the last rows are still being written.
+        save_summary(results, args.output)
+    clear_caches()
 
-    print(f"Stored {len(results)} regression coefficient records in {args.output}.")
+    print(f"Stored {len(results['model_label'])} regression coefficient records in {args.output}.")
 
 
 if __name__ == "__main__":